@@ -1,6 +1,6 @@
 """MCP Server for Xero integration."""
 
+from ._version import __version__ as __version__
 from .server import main
 
-__version__ = "0.1.0"
 __all__ = ["main"]
@@ -3,7 +3,7 @@
 import os
 import subprocess
 import sys
-from datetime import datetime
+import time
 from typing import Any
 
 import aiohttp
@@ -353,7 +353,7 @@ class XeroOAuth:
         tokens = TokenSet(
             access_token=data["access_token"],
             refresh_token=data.get("refresh_token", ""),  # May not have refresh token
-            expires_at=datetime.now().timestamp() + data["expires_in"],
+            expires_at=time.time() + data["expires_in"],
             token_type=data["token_type"],
             scope=data.get("scope", "").split(),
             tenant_id=tenant_id,
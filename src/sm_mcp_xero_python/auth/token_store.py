@@ -3,8 +3,8 @@
 import json
 import subprocess
 import sys
+import time
 from dataclasses import asdict, dataclass
-from datetime import datetime
 from typing import Self
 
 
@@ -55,7 +55,7 @@ class TokenSet:
     @property
     def is_expired(self) -> bool:
         """Check if the access token is expired."""
-        return datetime.now().timestamp() >= self.expires_at - 60  # 60s buffer
+        return time.time() >= self.expires_at - 60  # 60s buffer
 
     @property
     def active_tenant(self) -> Tenant | None:
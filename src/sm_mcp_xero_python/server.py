@@ -13,7 +13,7 @@ from mcp.types import TextContent
 from .auth import XeroOAuth
 from .auth.oauth import CREDENTIAL_PROFILES, get_active_profile
 from .tools import (
-    ALL_TOOLS,
+    get_all_tools,
     handle_auth_tool,
     handle_contact_tool,
     handle_invoice_tool,
@@ -94,7 +94,7 @@ class XeroMCPServer:
         @self.server.list_tools()
         async def list_tools():
             """List all available Xero tools."""
-            return ALL_TOOLS
+            return get_all_tools()
 
         @self.server.call_tool()
         async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
@@ -141,6 +141,9 @@ class XeroMCPServer:
                 "message": "Use xero_connect to connect to Xero first",
             }
 
+        # Key this call's cache lookups on the tenant the tokens now carry
+        client.note_tenant(tokens.tenant_id)
+
         # Contact tools
         if name.startswith("xero_") and "contact" in name:
             return await handle_contact_tool(name, arguments, client)
@@ -167,12 +170,17 @@ class XeroMCPServer:
         """Run the MCP server."""
         logger.info("Starting Xero MCP server")
 
-        async with stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream,
-                write_stream,
-                self.server.create_initialization_options(),
-            )
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    self.server.create_initialization_options(),
+                )
+        finally:
+            # Close pooled HTTP connections held by each profile's client
+            for client in self._client_instances.values():
+                await client.aclose()
 
 
 def main() -> None:
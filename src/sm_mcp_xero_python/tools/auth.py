@@ -294,6 +294,9 @@ async def handle_auth_tool(
 
         try:
             tokens = await oauth.authenticate_client_credentials()
+            # New tokens may carry a different default tenant
+            if server:
+                server.get_client(profile).reset_tenant()
             return {
                 "success": True,
                 "profile": profile,
@@ -317,6 +320,8 @@ async def handle_auth_tool(
 
             try:
                 tokens = await prof_oauth.authenticate_client_credentials()
+                # New tokens may carry a different default tenant
+                server.get_client(prof).reset_tenant()
                 results[prof] = {
                     "connected": True,
                     "tenant_id": tokens.tenant_id,
@@ -363,6 +368,8 @@ async def handle_auth_tool(
 
         success = oauth.set_active_tenant(tenant_id_or_code)
         if success:
+            if server:
+                server.get_client(profile).reset_tenant()
             # Get the tenant info for confirmation
             tenants = oauth.list_tenants()
             active = next((t for t in tenants if t["active"]), None)
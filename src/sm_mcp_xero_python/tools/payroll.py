@@ -1,5 +1,8 @@
 """Payroll tools for Xero MCP server."""
 
+import json
+from collections.abc import Iterator
+from operator import itemgetter
 from typing import Any, TYPE_CHECKING
 
 from mcp.types import Tool
@@ -7,8 +10,29 @@ from mcp.types import Tool
 from ..xero import XeroClient
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
     from ..server import XeroMCPServer
 
+# C-level field accessors for summing per-employee totals
+_get_wages = itemgetter("wages")
+_get_tax = itemgetter("tax")
+_get_super = itemgetter("super")
+
+# One [[employees]] table in the quarterly report TOML; name is pre-quoted
+_TOML_EMPLOYEE_TEMPLATE = (
+    "\n"
+    "[[employees]]\n"
+    "name = {name}\n"
+    "gross_wages = {wages:.2f}\n"
+    "allowances = {allowances:.2f}\n"
+    "ote = {ote:.2f}\n"
+    "overtime = {overtime:.2f}\n"
+    "tax = {tax:.2f}\n"
+    "superannuation = {super:.2f}\n"
+    "super_percentage = {super_percentage:.2f}\n"
+)
+
 PAYROLL_TOOLS = [
     Tool(
         name="xero_list_payruns",
@@ -98,6 +122,11 @@ PAYROLL_TOOLS = [
                     "type": "string",
                     "description": "Xero profile to use (e.g., 'SP', 'SM'). Defaults to active profile. Use 'ALL' to run across all connected profiles.",
                 },
+                "return_report": {
+                    "type": "boolean",
+                    "description": "Include the markdown report in the response. Set to false when only the saved TOML file and totals are needed. Default: true",
+                    "default": True,
+                },
             },
             "required": ["fiscal_year", "quarter"],
         },
@@ -149,19 +178,7 @@ async def _fetch_all_payruns(client: XeroClient, status: str | None = None) -> l
     Returns:
         List of all pay runs
     """
-    all_payruns = []
-    page = 1
-
-    while True:
-        payruns = await client.list_payruns(status=status, page=page)
-        if not payruns:
-            break
-        all_payruns.extend(payruns)
-        if len(payruns) < 100:  # Less than full page means we've got all
-            break
-        page += 1
-
-    return all_payruns
+    return await client.list_all_payruns(status=status)
 
 
 async def _build_employee_lookup(client: XeroClient) -> dict[str, str]:
@@ -174,20 +191,11 @@ async def _build_employee_lookup(client: XeroClient) -> dict[str, str]:
         Dictionary mapping EmployeeID to full name
     """
     lookup = {}
-    page = 1
-
-    while True:
-        employees = await client.list_payroll_employees(page=page)
-        if not employees:
-            break
-        for emp in employees:
-            emp_id = emp.get("EmployeeID", "")
-            first = emp.get("FirstName", "")
-            last = emp.get("LastName", "")
-            lookup[emp_id] = f"{first} {last}".strip()
-        if len(employees) < 100:
-            break
-        page += 1
+    for emp in await client.list_all_payroll_employees():
+        emp_id = emp.get("EmployeeID", "")
+        first = emp.get("FirstName", "")
+        last = emp.get("LastName", "")
+        lookup[emp_id] = f"{first} {last}".strip()
 
     return lookup
 
@@ -350,34 +358,36 @@ async def _run_quarterly_report_single(
             else:
                 employee_data[emp_name] = {"wages": wages, "allowances": allowances, "overtime": overtime, "tax": tax_amt, "super": super_amt}
 
-    total_wages = sum(data["wages"] for data in employee_data.values())
-    total_tax = sum(data["tax"] for data in employee_data.values())
-    total_super = sum(data["super"] for data in employee_data.values())
+    total_wages = sum(map(_get_wages, employee_data.values()))
+    total_tax = sum(map(_get_tax, employee_data.values()))
+    total_super = sum(map(_get_super, employee_data.values()))
     total_ote = total_wages - total_allowances - total_overtime
 
-    sorted_employees = sorted(employee_data.items(), key=lambda x: x[0])
+    sorted_names = sorted(employee_data)
+
+    employees = []
+    for name in sorted_names:
+        data = employee_data[name]
+        employees.append({
+            "name": name,
+            "wages": data["wages"],
+            "allowances": data["allowances"],
+            "ote": data["wages"] - data["allowances"] - data["overtime"],
+            "overtime": data["overtime"],
+            "tax": data["tax"],
+            "super": data["super"],
+        })
 
     return {
         "profile": profile,
-        "employee_count": len(sorted_employees),
+        "employee_count": len(sorted_names),
         "total_wages": total_wages,
         "total_allowances": total_allowances,
         "total_ote": total_ote,
         "total_overtime": total_overtime,
         "total_tax": total_tax,
         "total_super": total_super,
-        "employees": [
-            {
-                "name": name,
-                "wages": data["wages"],
-                "allowances": data["allowances"],
-                "ote": data["wages"] - data["allowances"] - data["overtime"],
-                "overtime": data["overtime"],
-                "tax": data["tax"],
-                "super": data["super"],
-            }
-            for name, data in sorted_employees
-        ],
+        "employees": employees,
     }
 
 
@@ -390,6 +400,7 @@ def _save_quarterly_report_toml(
     employees: list[dict[str, Any]],
     totals: dict[str, float],
     duration_seconds: float | None = None,
+    generated_at: "datetime | None" = None,
 ) -> str:
     """Save quarterly wages report to a TOML file.
 
@@ -402,6 +413,7 @@ def _save_quarterly_report_toml(
         employees: List of employee wage data
         totals: Total wages, allowances, OTE, overtime, tax, super
         duration_seconds: Time taken to generate the report
+        generated_at: Report generation timestamp (defaults to now)
 
     Returns:
         Path to the saved TOML file
@@ -415,84 +427,81 @@ def _save_quarterly_report_toml(
 
     # Format duration
     if duration_seconds:
-        duration_mins = int(duration_seconds // 60)
-        duration_secs = int(duration_seconds % 60)
+        duration_mins, duration_secs = divmod(int(duration_seconds), 60)
         duration_str = f"{duration_mins}:{duration_secs:02d}"
     else:
         duration_str = "N/A"
 
-    generated_at = datetime.now(timezone.utc)
-
-    # Build TOML content
+    if generated_at is None:
+        generated_at = datetime.now(timezone.utc)
     fy_upper = fiscal_year.upper()
-    lines = [
-        f"# Quarterly Payroll Report: {fy_upper} Q{quarter}",
-        f"# Profile: {profile}",
-        f"# Generated: {generated_at.strftime('%d-%m-%Y @ %H:%M UTC')} over {duration_str}",
-        "",
-        "[report]",
-        f'fiscal_year = "{fy_upper}"',
-        f"quarter = {quarter}",
-        f'profile = "{profile}"',
-        f'period_start = "{period_start}"',
-        f'period_end = "{period_end}"',
-        f'generated_at = "{generated_at.isoformat()}"',
-        f'generation_duration = "{duration_str}"',
-        "",
-        "[totals]",
-        f"gross_wages = {totals['wages']:.2f}",
-        f"allowances = {totals['allowances']:.2f}",
-        f"ote = {totals['ote']:.2f}",
-        f"overtime = {totals.get('overtime', 0.0):.2f}",
-        f"tax = {totals.get('tax', 0.0):.2f}",
-        f"superannuation = {totals['super']:.2f}",
-        f"super_percentage = {totals['super_percentage']:.2f}",
-        f"employee_count = {len(employees)}",
-        "",
-    ]
 
-    # Add employee details
-    for emp in employees:
-        lines.append(f'[[employees]]')
-        lines.append(f'name = "{emp["name"]}"')
-        lines.append(f"gross_wages = {emp['wages']:.2f}")
-        lines.append(f"allowances = {emp['allowances']:.2f}")
-        lines.append(f"ote = {emp['ote']:.2f}")
-        lines.append(f"overtime = {emp.get('overtime', 0.0):.2f}")
-        lines.append(f"tax = {emp.get('tax', 0.0):.2f}")
-        lines.append(f"superannuation = {emp['super']:.2f}")
-        lines.append(f"super_percentage = {emp['super_percentage']:.2f}")
-        lines.append("")
-
-    toml_content = "\n".join(lines)
-
-    # Save to file
+    def toml_lines() -> Iterator[str]:
+        yield f"# Quarterly Payroll Report: {fy_upper} Q{quarter}"
+        yield f"# Profile: {profile}"
+        yield f"# Generated: {generated_at.strftime('%d-%m-%Y @ %H:%M UTC')} over {duration_str}"
+        yield ""
+        yield "[report]"
+        yield f'fiscal_year = "{fy_upper}"'
+        yield f"quarter = {quarter}"
+        yield f'profile = "{profile}"'
+        yield f'period_start = "{period_start}"'
+        yield f'period_end = "{period_end}"'
+        yield f'generated_at = "{generated_at.isoformat()}"'
+        yield f'generation_duration = "{duration_str}"'
+        yield ""
+        yield "[totals]"
+        yield f"gross_wages = {totals['wages']:.2f}"
+        yield f"allowances = {totals['allowances']:.2f}"
+        yield f"ote = {totals['ote']:.2f}"
+        yield f"overtime = {totals.get('overtime', 0.0):.2f}"
+        yield f"tax = {totals.get('tax', 0.0):.2f}"
+        yield f"superannuation = {totals['super']:.2f}"
+        yield f"super_percentage = {totals['super_percentage']:.2f}"
+        yield f"employee_count = {len(employees)}"
+
+    # Stream to file rather than building the whole document in memory
     filename = f"{profile}-Payroll-{fy_upper}-Q{quarter}.toml"
     filepath = output_dir / filename
-    filepath.write_text(toml_content)
+    with filepath.open("w", buffering=1 << 20) as f:
+        for line in toml_lines():
+            f.write(line + "\n")
+
+        # Add employee details, one pre-built template per employee
+        for emp in employees:
+            f.write(_TOML_EMPLOYEE_TEMPLATE.format_map({
+                "overtime": 0.0,
+                "tax": 0.0,
+                **emp,
+                "name": json.dumps(emp["name"], ensure_ascii=False),
+            }))
 
     return str(filepath)
 
 
-async def _run_quarterly_report_all_profiles(
-    server: "XeroMCPServer",
+def _format_all_profiles_report(
     fiscal_year: str,
     quarter: int,
-) -> dict[str, Any]:
-    """Run quarterly wages report across all connected profiles.
+    start_date: str,
+    end_date: str,
+    profile_results: dict[str, dict[str, Any]],
+    grand_totals: dict[str, float],
+    super_percentage: float,
+) -> str:
+    """Build the combined markdown report for a quarterly run across profiles.
 
     Args:
-        server: Server instance with access to all profiles
         fiscal_year: Fiscal year (e.g., "FY25")
         quarter: Quarter number (1-4)
+        start_date: Period start (YYYY-MM-DD)
+        end_date: Period end (YYYY-MM-DD)
+        profile_results: Per-profile report data or errors
+        grand_totals: Combined wages, allowances, OTE and super
+        super_percentage: Combined super as a percentage of OTE
 
     Returns:
-        Combined report data from all profiles
+        Markdown report
     """
-    from ..auth.oauth import CREDENTIAL_PROFILES
-
-    start_date, end_date = _get_quarter_dates(fiscal_year, quarter)
-
     # Format dates as DD-MM-YYYY
     def format_date(date_str: str) -> str:
         parts = date_str.split("-")
@@ -501,50 +510,6 @@ async def _run_quarterly_report_all_profiles(
     start_date_fmt = format_date(start_date)
     end_date_fmt = format_date(end_date)
 
-    profile_results = {}
-    all_employees: dict[str, dict[str, float]] = {}
-    grand_totals = {
-        "wages": 0.0,
-        "allowances": 0.0,
-        "ote": 0.0,
-        "super": 0.0,
-    }
-
-    # Run report for each connected profile
-    for profile in CREDENTIAL_PROFILES:
-        oauth = server.get_oauth(profile)
-        tokens = await oauth.get_valid_tokens()
-        if not tokens:
-            profile_results[profile] = {"connected": False, "error": "Not authenticated"}
-            continue
-
-        client = server.get_client(profile)
-        try:
-            result = await _run_quarterly_report_single(client, profile, fiscal_year, quarter)
-            profile_results[profile] = result
-
-            # Aggregate into combined totals
-            grand_totals["wages"] += result["total_wages"]
-            grand_totals["allowances"] += result["total_allowances"]
-            grand_totals["ote"] += result["total_ote"]
-            grand_totals["super"] += result["total_super"]
-
-            # Combine employees (prefix with profile for uniqueness)
-            for emp in result["employees"]:
-                key = f"{emp['name']} ({profile})"
-                all_employees[key] = {
-                    "wages": emp["wages"],
-                    "allowances": emp["allowances"],
-                    "ote": emp["ote"],
-                    "super": emp["super"],
-                    "profile": profile,
-                }
-        except Exception as e:
-            profile_results[profile] = {"connected": True, "error": str(e)}
-
-    # Calculate combined super percentage
-    super_percentage = (grand_totals["super"] / grand_totals["ote"] * 100) if grand_totals["ote"] > 0 else 0
-
     # Build combined markdown report
     lines = [
         f"## Quarterly Wages Report: {fiscal_year}-Q{quarter} (All Profiles)",
@@ -600,10 +565,75 @@ async def _run_quarterly_report_all_profiles(
 
     lines.append("*Super % calculated on OTE (excluding allowances)*")
 
-    report = "\n".join(lines)
+    return "\n".join(lines)
 
-    return {
-        "report": report,
+
+async def _run_quarterly_report_all_profiles(
+    server: "XeroMCPServer",
+    fiscal_year: str,
+    quarter: int,
+    return_report: bool = True,
+) -> dict[str, Any]:
+    """Run quarterly wages report across all connected profiles.
+
+    Args:
+        server: Server instance with access to all profiles
+        fiscal_year: Fiscal year (e.g., "FY25")
+        quarter: Quarter number (1-4)
+        return_report: Whether to include the combined markdown report
+
+    Returns:
+        Combined report data from all profiles
+    """
+    from ..auth.oauth import CREDENTIAL_PROFILES
+
+    start_date, end_date = _get_quarter_dates(fiscal_year, quarter)
+
+    profile_results = {}
+    all_employees: dict[str, dict[str, float]] = {}
+    grand_totals = {
+        "wages": 0.0,
+        "allowances": 0.0,
+        "ote": 0.0,
+        "super": 0.0,
+    }
+
+    # Run report for each connected profile
+    for profile in CREDENTIAL_PROFILES:
+        oauth = server.get_oauth(profile)
+        tokens = await oauth.get_valid_tokens()
+        if not tokens:
+            profile_results[profile] = {"connected": False, "error": "Not authenticated"}
+            continue
+
+        client = server.get_client(profile)
+        try:
+            result = await _run_quarterly_report_single(client, profile, fiscal_year, quarter)
+            profile_results[profile] = result
+
+            # Aggregate into combined totals
+            grand_totals["wages"] += result["total_wages"]
+            grand_totals["allowances"] += result["total_allowances"]
+            grand_totals["ote"] += result["total_ote"]
+            grand_totals["super"] += result["total_super"]
+
+            # Combine employees (prefix with profile for uniqueness)
+            for emp in result["employees"]:
+                key = f"{emp['name']} ({profile})"
+                all_employees[key] = {
+                    "wages": emp["wages"],
+                    "allowances": emp["allowances"],
+                    "ote": emp["ote"],
+                    "super": emp["super"],
+                    "profile": profile,
+                }
+        except Exception as e:
+            profile_results[profile] = {"connected": True, "error": str(e)}
+
+    # Calculate combined super percentage
+    super_percentage = (grand_totals["super"] / grand_totals["ote"] * 100) if grand_totals["ote"] > 0 else 0
+
+    response: dict[str, Any] = {
         "fiscal_year": fiscal_year,
         "quarter": quarter,
         "period_start": start_date,
@@ -617,6 +647,17 @@ async def _run_quarterly_report_all_profiles(
             "super_percentage": super_percentage,
         },
     }
+    if return_report:
+        response["report"] = _format_all_profiles_report(
+            fiscal_year,
+            quarter,
+            start_date,
+            end_date,
+            profile_results,
+            grand_totals,
+            super_percentage,
+        )
+    return response
 
 
 async def handle_payroll_tool(
@@ -720,16 +761,17 @@ async def handle_payroll_tool(
             from datetime import datetime, timezone
             import time
 
-            report_start_time = time.time()
+            report_start = time.perf_counter()
 
             fiscal_year = arguments["fiscal_year"]
             quarter = arguments["quarter"]
             profile_arg = arguments.get("profile", "").upper()
+            return_report = arguments.get("return_report", True)
 
             # Check if running across all profiles
             if profile_arg == "ALL" and server:
                 return await _run_quarterly_report_all_profiles(
-                    server, fiscal_year, quarter
+                    server, fiscal_year, quarter, return_report
                 )
 
             # Calculate date range for the quarter
@@ -817,16 +859,16 @@ async def handle_payroll_tool(
                         employee_data[emp_name] = {"wages": wages, "allowances": allowances, "overtime": overtime, "tax": tax_amt, "super": super_amt}
 
             # Calculate totals
-            total_wages = sum(data["wages"] for data in employee_data.values())
-            total_tax = sum(data["tax"] for data in employee_data.values())
-            total_super = sum(data["super"] for data in employee_data.values())
+            total_wages = sum(map(_get_wages, employee_data.values()))
+            total_tax = sum(map(_get_tax, employee_data.values()))
+            total_super = sum(map(_get_super, employee_data.values()))
             total_ote = total_wages - total_allowances - total_overtime  # OTE = wages minus allowances and overtime
 
             # Super percentage based on OTE (excluding allowances and overtime)
             super_percentage = (total_super / total_ote * 100) if total_ote > 0 else 0
 
             # Sort by name
-            sorted_employees = sorted(employee_data.items(), key=lambda x: x[0])
+            sorted_names = sorted(employee_data)
 
             # Format dates as DD-MM-YYYY
             def format_date(date_str: str) -> str:
@@ -836,17 +878,22 @@ async def handle_payroll_tool(
             start_date_fmt = format_date(start_date)
             end_date_fmt = format_date(end_date)
 
-            # Build markdown table with right-aligned numbers
-            lines = [
-                f"## Quarterly Wages Report: {fiscal_year}-Q{quarter}",
-                "",
-                f"**Period:** {start_date_fmt} to {end_date_fmt}",
-                "",
-                "| Employee | Gross Wages | Allowances | Ordinary Time | Over Time | Taxes | Super | Super % |",
-                "|:---------|------------:|-----------:|--------------:|----------:|------:|------:|--------:|",
-            ]
-
-            for emp_name, data in sorted_employees:
+            # Build markdown table with right-aligned numbers (skipped if not requested)
+            lines: list[str] = []
+            if return_report:
+                lines = [
+                    f"## Quarterly Wages Report: {fiscal_year}-Q{quarter}",
+                    "",
+                    f"**Period:** {start_date_fmt} to {end_date_fmt}",
+                    "",
+                    "| Employee | Gross Wages | Allowances | Ordinary Time | Over Time | Taxes | Super | Super % |",
+                    "|:---------|------------:|-----------:|--------------:|----------:|------:|------:|--------:|",
+                ]
+
+            # Build employees list for TOML, rendering each markdown row from the same values
+            employees_list = []
+            for emp_name in sorted_names:
+                data = employee_data[emp_name]
                 emp_wages = data["wages"]
                 emp_allowances = data["allowances"]
                 emp_overtime = data["overtime"]
@@ -854,32 +901,27 @@ async def handle_payroll_tool(
                 emp_tax = data["tax"]
                 emp_super = data["super"]
                 emp_super_pct = (emp_super / emp_ote * 100) if emp_ote > 0 else 0
-                lines.append(f"| {emp_name} | ${emp_wages:,.2f} | ${emp_allowances:,.2f} | ${emp_ote:,.2f} | ${emp_overtime:,.2f} | ${emp_tax:,.2f} | ${emp_super:,.2f} | {emp_super_pct:.2f}% |")
-
-            lines.append(f"| **Total** | **${total_wages:,.2f}** | **${total_allowances:,.2f}** | **${total_ote:,.2f}** | **${total_overtime:,.2f}** | **${total_tax:,.2f}** | **${total_super:,.2f}** | **{super_percentage:.2f}%** |")
-            lines.append("")
-            lines.append("*Super % calculated on Ordinary Time (excluding allowances and over time)*")
-
-            # Build employees list for TOML
-            employees_list = [
-                {
-                    "name": name,
-                    "wages": data["wages"],
-                    "allowances": data["allowances"],
-                    "ote": data["wages"] - data["allowances"] - data["overtime"],
-                    "overtime": data["overtime"],
-                    "tax": data["tax"],
-                    "super": data["super"],
-                    "super_percentage": (data["super"] / (data["wages"] - data["allowances"] - data["overtime"]) * 100) if (data["wages"] - data["allowances"] - data["overtime"]) > 0 else 0,
-                }
-                for name, data in sorted_employees
-            ]
-
-            # Calculate duration
-            report_end_time = time.time()
-            duration_seconds = report_end_time - report_start_time
-            duration_mins = int(duration_seconds // 60)
-            duration_secs = int(duration_seconds % 60)
+                employees_list.append({
+                    "name": emp_name,
+                    "wages": emp_wages,
+                    "allowances": emp_allowances,
+                    "ote": emp_ote,
+                    "overtime": emp_overtime,
+                    "tax": emp_tax,
+                    "super": emp_super,
+                    "super_percentage": emp_super_pct,
+                })
+                if return_report:
+                    lines.append(f"| {emp_name} | ${emp_wages:,.2f} | ${emp_allowances:,.2f} | ${emp_ote:,.2f} | ${emp_overtime:,.2f} | ${emp_tax:,.2f} | ${emp_super:,.2f} | {emp_super_pct:.2f}% |")
+
+            if return_report:
+                lines.append(f"| **Total** | **${total_wages:,.2f}** | **${total_allowances:,.2f}** | **${total_ote:,.2f}** | **${total_overtime:,.2f}** | **${total_tax:,.2f}** | **${total_super:,.2f}** | **{super_percentage:.2f}%** |")
+                lines.append("")
+                lines.append("*Super % calculated on Ordinary Time (excluding allowances and over time)*")
+
+            # Calculate duration (monotonic clock) and take a single wall-clock reading
+            duration_seconds = time.perf_counter() - report_start
+            duration_mins, duration_secs = divmod(int(duration_seconds), 60)
             generated_at = datetime.now(timezone.utc)
             generated_str = generated_at.strftime("%d-%m-%Y @ %H:%M UTC")
             duration_str = f"{duration_mins}:{duration_secs:02d}"
@@ -903,23 +945,16 @@ async def handle_payroll_tool(
                     "super_percentage": super_percentage,
                 },
                 duration_seconds=duration_seconds,
+                generated_at=generated_at,
             )
 
-            # Add metadata to report
-            lines.append("")
-            lines.append(f"*Report generated on {generated_str} over {duration_str}*")
-            lines.insert(3, f"**Saved to:** `{filepath}`")
-
-            report = "\n".join(lines)
-
-            return {
-                "report": report,
+            response: dict[str, Any] = {
                 "fiscal_year": fiscal_year,
                 "quarter": quarter,
                 "period_start": start_date,
                 "period_end": end_date,
                 "file_path": filepath,
-                "employee_count": len(sorted_employees),
+                "employee_count": len(sorted_names),
                 "total_wages": total_wages,
                 "total_allowances": total_allowances,
                 "total_ote": total_ote,
@@ -929,6 +964,13 @@ async def handle_payroll_tool(
                 "super_percentage": super_percentage,
                 "employees": employees_list,
             }
+            if return_report:
+                # Add metadata to report
+                lines.append("")
+                lines.append(f"*Report generated on {generated_str} over {duration_str}*")
+                lines.insert(3, f"**Saved to:** `{filepath}`")
+                response["report"] = "\n".join(lines)
+            return response
 
     except Exception as e:
         return {"error": str(e)}
@@ -6,214 +6,220 @@ from mcp.types import Tool
 
 from ..xero import XeroClient
 
-PURCHASE_ORDER_TOOLS = [
-    Tool(
-        name="xero_list_purchase_orders",
-        description="List purchase orders from Xero with optional filtering by status, contact, or date range.",
-        inputSchema={
+# Built on first use so the schema object graph isn't allocated at import time
+_PURCHASE_ORDER_TOOLS: list[Tool] | None = None
+
+
+def get_purchase_order_tools() -> list[Tool]:
+    """Get purchase order tool definitions, building them on first call."""
+    global _PURCHASE_ORDER_TOOLS
+    if _PURCHASE_ORDER_TOOLS is None:
+        # Shared by the create and update schemas
+        line_item_schema = {
             "type": "object",
             "properties": {
-                "status": {
-                    "type": "string",
-                    "description": "Filter by purchase order status",
-                    "enum": ["DRAFT", "SUBMITTED", "AUTHORISED", "BILLED", "DELETED"],
-                },
-                "contact_id": {
-                    "type": "string",
-                    "description": "Filter by contact (supplier) ID",
-                },
-                "date_from": {
+                "description": {
                     "type": "string",
-                    "description": "Filter POs from this date (YYYY-MM-DD format)",
+                    "description": "Line item description",
                 },
-                "date_to": {
-                    "type": "string",
-                    "description": "Filter POs to this date (YYYY-MM-DD format)",
-                },
-                "page": {
-                    "type": "integer",
-                    "description": "Page number for pagination. Default: 1",
+                "quantity": {
+                    "type": "number",
+                    "description": "Quantity (default: 1)",
                     "default": 1,
-                    "minimum": 1,
                 },
-            },
-            "required": [],
-        },
-    ),
-    Tool(
-        name="xero_get_purchase_order",
-        description="Get detailed information about a specific purchase order by its ID or PO number.",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "purchase_order_id": {
-                    "type": "string",
-                    "description": "The Xero purchase order ID (UUID format) or PO number",
+                "unit_amount": {
+                    "type": "number",
+                    "description": "Price per unit (ex GST)",
                 },
-            },
-            "required": ["purchase_order_id"],
-        },
-    ),
-    Tool(
-        name="xero_create_purchase_order",
-        description="Create a new purchase order in Xero for a supplier contact with line items. You can specify either contact_id or contact_name (contact_name will search for the contact).",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "contact_id": {
+                "account_code": {
                     "type": "string",
-                    "description": "Contact ID (supplier) to create the PO for (use this OR contact_name)",
+                    "description": "Account code (e.g., '300' for Purchases)",
                 },
-                "contact_name": {
+                "tax_type": {
                     "type": "string",
-                    "description": "Contact name to search for (use this OR contact_id)",
+                    "description": "Tax type (e.g., 'INPUT' for GST on expenses)",
                 },
-                "line_items": {
-                    "type": "array",
-                    "description": "List of line items for the purchase order",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "description": {
-                                "type": "string",
-                                "description": "Line item description",
-                            },
-                            "quantity": {
-                                "type": "number",
-                                "description": "Quantity (default: 1)",
-                                "default": 1,
-                            },
-                            "unit_amount": {
-                                "type": "number",
-                                "description": "Price per unit (ex GST)",
-                            },
-                            "account_code": {
-                                "type": "string",
-                                "description": "Account code (e.g., '300' for Purchases)",
-                            },
-                            "tax_type": {
-                                "type": "string",
-                                "description": "Tax type (e.g., 'INPUT' for GST on expenses)",
-                            },
+            },
+            "required": ["description", "unit_amount"],
+        }
+
+        _PURCHASE_ORDER_TOOLS = [
+            Tool(
+                name="xero_list_purchase_orders",
+                description="List purchase orders from Xero with optional filtering by status, contact, or date range.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "status": {
+                            "type": "string",
+                            "description": "Filter by purchase order status",
+                            "enum": ["DRAFT", "SUBMITTED", "AUTHORISED", "BILLED", "DELETED"],
+                        },
+                        "contact_id": {
+                            "type": "string",
+                            "description": "Filter by contact (supplier) ID",
+                        },
+                        "date_from": {
+                            "type": "string",
+                            "description": "Filter POs from this date (YYYY-MM-DD format)",
+                        },
+                        "date_to": {
+                            "type": "string",
+                            "description": "Filter POs to this date (YYYY-MM-DD format)",
+                        },
+                        "page": {
+                            "type": "integer",
+                            "description": "Page number for pagination. Default: 1",
+                            "default": 1,
+                            "minimum": 1,
+                        },
+                        "pages": {
+                            "type": "integer",
+                            "description": "Number of consecutive pages to fetch concurrently, starting at 'page'. Default: 1",
+                            "default": 1,
+                            "minimum": 1,
+                            "maximum": 20,
                         },
-                        "required": ["description", "unit_amount"],
                     },
+                    "required": [],
                 },
-                "date": {
-                    "type": "string",
-                    "description": "PO date (YYYY-MM-DD). Defaults to today.",
-                },
-                "delivery_date": {
-                    "type": "string",
-                    "description": "Expected delivery date (YYYY-MM-DD)",
-                },
-                "purchase_order_number": {
-                    "type": "string",
-                    "description": "PO number (auto-generated if not provided)",
-                },
-                "reference": {
-                    "type": "string",
-                    "description": "Reference text (e.g., supplier quote number)",
-                },
-                "delivery_address": {
-                    "type": "string",
-                    "description": "Delivery address",
-                },
-                "attention_to": {
-                    "type": "string",
-                    "description": "Attention to name",
-                },
-                "telephone": {
-                    "type": "string",
-                    "description": "Contact telephone number",
-                },
-                "delivery_instructions": {
-                    "type": "string",
-                    "description": "Special delivery instructions",
-                },
-                "currency_code": {
-                    "type": "string",
-                    "description": "Currency code (default: AUD)",
-                    "default": "AUD",
-                },
-                "status": {
-                    "type": "string",
-                    "description": "Initial status. Default: DRAFT",
-                    "enum": ["DRAFT", "SUBMITTED"],
-                    "default": "DRAFT",
-                },
-            },
-            "required": ["line_items"],
-        },
-    ),
-    Tool(
-        name="xero_update_purchase_order",
-        description="Update an existing purchase order. Only provide fields you want to change. Note: POs can only be updated when in DRAFT or SUBMITTED status.",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "purchase_order_id": {
-                    "type": "string",
-                    "description": "Purchase order ID to update",
-                },
-                "status": {
-                    "type": "string",
-                    "description": "New status",
-                    "enum": ["DRAFT", "SUBMITTED", "AUTHORISED", "DELETED"],
-                },
-                "line_items": {
-                    "type": "array",
-                    "description": "Updated line items (replaces all existing items)",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "description": {"type": "string"},
-                            "quantity": {"type": "number"},
-                            "unit_amount": {"type": "number"},
-                            "account_code": {"type": "string"},
-                            "tax_type": {"type": "string"},
+            ),
+            Tool(
+                name="xero_get_purchase_order",
+                description="Get detailed information about a specific purchase order by its ID or PO number.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "purchase_order_id": {
+                            "type": "string",
+                            "description": "The Xero purchase order ID (UUID format) or PO number",
                         },
-                        "required": ["description", "unit_amount"],
                     },
+                    "required": ["purchase_order_id"],
                 },
-                "delivery_date": {
-                    "type": "string",
-                    "description": "New delivery date (YYYY-MM-DD)",
-                },
-                "reference": {
-                    "type": "string",
-                    "description": "New reference",
-                },
-                "delivery_address": {
-                    "type": "string",
-                    "description": "New delivery address",
+            ),
+            Tool(
+                name="xero_create_purchase_order",
+                description="Create a new purchase order in Xero for a supplier contact with line items. You can specify either contact_id or contact_name (contact_name will search for the contact).",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "contact_id": {
+                            "type": "string",
+                            "description": "Contact ID (supplier) to create the PO for (use this OR contact_name)",
+                        },
+                        "contact_name": {
+                            "type": "string",
+                            "description": "Contact name to search for (use this OR contact_id)",
+                        },
+                        "line_items": {
+                            "type": "array",
+                            "description": "List of line items for the purchase order",
+                            "items": line_item_schema,
+                        },
+                        "date": {
+                            "type": "string",
+                            "description": "PO date (YYYY-MM-DD). Defaults to today.",
+                        },
+                        "delivery_date": {
+                            "type": "string",
+                            "description": "Expected delivery date (YYYY-MM-DD)",
+                        },
+                        "purchase_order_number": {
+                            "type": "string",
+                            "description": "PO number (auto-generated if not provided)",
+                        },
+                        "reference": {
+                            "type": "string",
+                            "description": "Reference text (e.g., supplier quote number)",
+                        },
+                        "delivery_address": {
+                            "type": "string",
+                            "description": "Delivery address",
+                        },
+                        "attention_to": {
+                            "type": "string",
+                            "description": "Attention to name",
+                        },
+                        "telephone": {
+                            "type": "string",
+                            "description": "Contact telephone number",
+                        },
+                        "delivery_instructions": {
+                            "type": "string",
+                            "description": "Special delivery instructions",
+                        },
+                        "currency_code": {
+                            "type": "string",
+                            "description": "Currency code (default: AUD)",
+                            "default": "AUD",
+                        },
+                        "status": {
+                            "type": "string",
+                            "description": "Initial status. Default: DRAFT",
+                            "enum": ["DRAFT", "SUBMITTED"],
+                            "default": "DRAFT",
+                        },
+                    },
+                    "required": ["line_items"],
                 },
-                "attention_to": {
-                    "type": "string",
-                    "description": "New attention to name",
+            ),
+            Tool(
+                name="xero_update_purchase_order",
+                description="Update an existing purchase order. Only provide fields you want to change. Note: POs can only be updated when in DRAFT or SUBMITTED status.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "purchase_order_id": {
+                            "type": "string",
+                            "description": "Purchase order ID to update",
+                        },
+                        "status": {
+                            "type": "string",
+                            "description": "New status",
+                            "enum": ["DRAFT", "SUBMITTED", "AUTHORISED", "DELETED"],
+                        },
+                        "line_items": {
+                            "type": "array",
+                            "description": "Updated line items (replaces all existing items)",
+                            "items": line_item_schema,
+                        },
+                        "delivery_date": {
+                            "type": "string",
+                            "description": "New delivery date (YYYY-MM-DD)",
+                        },
+                        "reference": {
+                            "type": "string",
+                            "description": "New reference",
+                        },
+                        "delivery_address": {
+                            "type": "string",
+                            "description": "New delivery address",
+                        },
+                        "attention_to": {
+                            "type": "string",
+                            "description": "New attention to name",
+                        },
+                    },
+                    "required": ["purchase_order_id"],
                 },
-            },
-            "required": ["purchase_order_id"],
-        },
-    ),
-]
+            ),
+        ]
+    return _PURCHASE_ORDER_TOOLS
 
 
 def _format_line_items(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Format line items from tool input to Xero API format."""
-    formatted = []
-    for item in items:
-        formatted_item = {
+    return [
+        {
             "Description": item.get("description", ""),
             "Quantity": item.get("quantity", 1),
             "UnitAmount": item.get("unit_amount", 0),
+            **({"AccountCode": item["account_code"]} if "account_code" in item else {}),
+            **({"TaxType": item["tax_type"]} if "tax_type" in item else {}),
         }
-        if "account_code" in item:
-            formatted_item["AccountCode"] = item["account_code"]
-        if "tax_type" in item:
-            formatted_item["TaxType"] = item["tax_type"]
-        formatted.append(formatted_item)
-    return formatted
+        for item in items
+    ]
 
 
 async def handle_purchase_order_tool(name: str, arguments: dict[str, Any], client: XeroClient) -> dict[str, Any]:
@@ -229,39 +235,49 @@ async def handle_purchase_order_tool(name: str, arguments: dict[str, Any], clien
     """
     try:
         if name == "xero_list_purchase_orders":
-            purchase_orders = await client.list_purchase_orders(
-                status=arguments.get("status"),
-                contact_id=arguments.get("contact_id"),
-                page=arguments.get("page", 1),
-                date_from=arguments.get("date_from"),
-                date_to=arguments.get("date_to"),
-            )
+            filters = {
+                "status": arguments.get("status"),
+                "contact_id": arguments.get("contact_id"),
+                "date_from": arguments.get("date_from"),
+                "date_to": arguments.get("date_to"),
+            }
+            page = arguments.get("page", 1)
+            pages = arguments.get("pages", 1)
+
+            if pages > 1:
+                purchase_orders = await client.list_purchase_order_pages(
+                    pages=pages, first_page=page, **filters
+                )
+            else:
+                purchase_orders = await client.list_purchase_orders(page=page, **filters)
+            projected = [
+                {
+                    "id": po.get("PurchaseOrderID"),
+                    "number": po.get("PurchaseOrderNumber"),
+                    "contact_name": po.get("Contact", {}).get("Name"),
+                    "status": po.get("Status"),
+                    "date": po.get("Date"),
+                    "delivery_date": po.get("DeliveryDate"),
+                    "total": po.get("Total"),
+                    "currency": po.get("CurrencyCode"),
+                }
+                for po in purchase_orders
+            ]
             return {
-                "purchase_orders": [
-                    {
-                        "id": po.get("PurchaseOrderID"),
-                        "number": po.get("PurchaseOrderNumber"),
-                        "contact_name": po.get("Contact", {}).get("Name"),
-                        "status": po.get("Status"),
-                        "date": po.get("Date"),
-                        "delivery_date": po.get("DeliveryDate"),
-                        "total": po.get("Total"),
-                        "currency": po.get("CurrencyCode"),
-                    }
-                    for po in purchase_orders
-                ],
-                "count": len(purchase_orders),
+                "purchase_orders": projected,
+                "count": len(projected),
             }
 
         elif name == "xero_get_purchase_order":
             po = await client.get_purchase_order(arguments["purchase_order_id"])
+            contact = po.get("Contact", {})
             return {
                 "purchase_order": {
                     "id": po.get("PurchaseOrderID"),
                     "number": po.get("PurchaseOrderNumber"),
                     "contact": {
-                        "id": po.get("Contact", {}).get("ContactID"),
-                        "name": po.get("Contact", {}).get("Name"),
+                        "id": contact.get("ContactID"),
+                        "name": contact.get("Name"),
                     },
                     "status": po.get("Status"),
                     "date": po.get("Date"),
@@ -3,13 +3,24 @@
 import asyncio
 import logging
 import mimetypes
-from datetime import datetime
+import random
+import re
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 from typing import Any
 
 import aiohttp
+import orjson
 
+from .._version import __version__
 from ..auth import XeroOAuth
+from ..auth.token_store import TokenSet
 
 logger = logging.getLogger(__name__)
 
@@ -20,11 +31,144 @@ XERO_PAYROLL_AU_BASE = "https://api.xero.com/payroll.xro/1.0"
 # Rate limit configuration
 RATE_LIMIT_REQUESTS = 50  # per minute (conservative, Xero allows 60)
 RATE_LIMIT_WINDOW = 60  # seconds
-MIN_REQUEST_INTERVAL = 1.2  # minimum seconds between requests to avoid bursts
+RATE_LIMIT_BURST = 10  # token bucket capacity; burst + refill stays under 60/min
+MAX_CONCURRENT_REQUESTS = 5  # Xero allows at most 5 concurrent calls per tenant
+PAGE_SIZE = 100  # records per page on paged Xero endpoints
+RATE_LIMIT_MAX_RETRIES = 5  # attempts per request when Xero answers 429
+RATE_LIMIT_RETRY_JITTER = 0.25  # up to +25% on Retry-After so waiters don't wake together
+
+# Exponential backoff for transient failures (connection errors, timeouts, 5xx)
+RETRY_BACKOFF_BASE = 1.0  # seconds
+RETRY_BACKOFF_CAP = 30.0  # seconds
+RETRY_BACKOFF_JITTER = 0.5  # up to +50% per delay
+RETRY_MAX_ATTEMPTS = 5  # attempts per request for transient failures, separate from 429s
+# Methods that are safe to resend after a transient failure
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})
+
+# Shared HTTP connection pool
+HTTP_CONNECTION_LIMIT = 50
+HTTP_CONNECTION_LIMIT_PER_HOST = 20
+HTTP_KEEPALIVE_TIMEOUT = 75  # seconds an idle connection is kept open
+DNS_CACHE_TTL = 300  # seconds
+HTTP_TIMEOUT = 30  # seconds per request
+ATTACHMENT_TIMEOUT = 120  # seconds per upload; files can be several MB
+USER_AGENT = f"sm-mcp-xero/{__version__}"
 
 # Default account codes for invoices
 DEFAULT_SALES_ACCOUNT_CODE = "201"  # Sales - SP
 
+# Contact name lookup cache; also backs xero_find_contact, so edits in Xero show up quickly
+CONTACT_CACHE_SIZE = 512
+CONTACT_CACHE_TTL = 60  # seconds
+
+# Single-record GET cache; the short quote/invoice TTL absorbs fetch-then-update re-reads
+RECORD_CACHE_SIZE = 256
+RECORD_CACHE_TTL = {"Contacts": CONTACT_CACHE_TTL, "Quotes": 5, "Invoices": 5}  # seconds
+
+# Purchase order (ContactID, Date) needed to post an update without re-fetching
+PO_META_CACHE_SIZE = 512
+PO_META_CACHE_TTL = 300  # seconds; bounds staleness if the PO is edited in Xero
+
+# Purchase orders sent per POST when creating in bulk
+PO_BATCH_SIZE = 50
+
+# Today's local date as YYYY-MM-DD, and the epoch time at which it rolls over
+_today_cache: tuple[float, str] = (0.0, "")
+
+
+def _today() -> str:
+    """Get today's local date as YYYY-MM-DD, formatted once per day."""
+    global _today_cache
+    expires_at, today = _today_cache
+    if time.time() < expires_at:
+        return today
+    now = datetime.now()
+    today = now.strftime("%Y-%m-%d")
+    midnight = now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+    _today_cache = (midnight.timestamp(), today)
+    return today
+
+
+# Filter dates must be YYYY-MM-DD
+_ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def _filter_date(value: str) -> str:
+    """Convert a YYYY-MM-DD date to Xero's DateTime(YYYY,MM,DD) argument form.
+
+    Args:
+        value: Date string
+
+    Returns:
+        Date with dashes replaced by commas
+
+    Raises:
+        XeroAPIError: If the date is not in YYYY-MM-DD format
+    """
+    if not _ISO_DATE.fullmatch(value):
+        raise XeroAPIError(f"Invalid date '{value}', expected YYYY-MM-DD", status_code=400)
+    return value.replace("-", ",")
+
+
+@lru_cache(maxsize=256)
+def _build_where(
+    status: str | None = None,
+    contact_id: str | None = None,
+    contact_name: str | None = None,
+    date_from: str | None = None,
+    date_to: str | None = None,
+    where: str | None = None,
+    base: str | None = None,
+) -> str | None:
+    """Build a Xero `where` filter from the common list filters.
+
+    Cached, since agents tend to repeat the same filtered queries.
+
+    Args:
+        status: Filter by status
+        contact_id: Filter by contact ID
+        contact_name: Filter by contact name (partial match)
+        date_from: Filter from date (YYYY-MM-DD)
+        date_to: Filter to date (YYYY-MM-DD)
+        where: Additional where clause (Xero filter syntax)
+        base: Clause that always comes first (e.g., invoice type)
+
+    Returns:
+        Clauses joined with AND, or None if there are no filters
+
+    Raises:
+        XeroAPIError: If a date is not in YYYY-MM-DD format
+    """
+    where_clauses = [base] if base else []
+
+    if status:
+        where_clauses.append(f'Status=="{status}"')
+    if contact_id:
+        where_clauses.append(f'Contact.ContactID==Guid("{contact_id}")')
+    if contact_name:
+        # Use Contains for partial name matching
+        where_clauses.append(f'Contact.Name.Contains("{contact_name}")')
+    if date_from:
+        where_clauses.append(f"Date>=DateTime({_filter_date(date_from)})")
+    if date_to:
+        where_clauses.append(f"Date<=DateTime({_filter_date(date_to)})")
+    if where:
+        where_clauses.append(where)
+
+    return " AND ".join(where_clauses) or None
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Get the jittered exponential backoff delay before retry number attempt + 1."""
+    delay = RETRY_BACKOFF_BASE * 2**attempt * (1 + random.random() * RETRY_BACKOFF_JITTER)
+    return min(RETRY_BACKOFF_CAP, delay)
+
+
+class _NormalizedLineItems(list):
+    """Line items that have already been through _ensure_line_item_account_code."""
+
+    __slots__ = ()
+
 
 def _ensure_line_item_account_code(
     line_items: list[dict[str, Any]], default_code: str = DEFAULT_SALES_ACCOUNT_CODE
@@ -36,29 +180,170 @@ def _ensure_line_item_account_code(
         default_code: Default account code to use if not specified
 
     Returns:
-        Line items with AccountCode ensured
+        Line items with AccountCode ensured (items that already have one are
+        passed through uncopied)
     """
-    processed = []
-    for item in line_items:
-        item_copy = dict(item)
-        if "AccountCode" not in item_copy and "AccountID" not in item_copy:
-            item_copy["AccountCode"] = default_code
-        processed.append(item_copy)
-    return processed
+    if isinstance(line_items, _NormalizedLineItems):
+        return line_items
+    return _NormalizedLineItems(
+        item
+        if "AccountCode" in item or "AccountID" in item
+        else {**item, "AccountCode": default_code}
+        for item in line_items
+    )
+
+
+def _build_po_payload(
+    contact_id: str,
+    line_items: list[dict[str, Any]],
+    date: str | None = None,
+    delivery_date: str | None = None,
+    purchase_order_number: str | None = None,
+    reference: str | None = None,
+    delivery_address: str | None = None,
+    attention_to: str | None = None,
+    telephone: str | None = None,
+    delivery_instructions: str | None = None,
+    currency_code: str = "AUD",
+    status: str = "DRAFT",
+) -> dict[str, Any]:
+    """Build the Xero payload for one new purchase order.
+
+    Args:
+        contact_id: Contact ID (supplier)
+        line_items: Line items in Xero format
+        date: PO date (YYYY-MM-DD), defaults to today
+        delivery_date: Expected delivery date (YYYY-MM-DD)
+        purchase_order_number: PO number (auto-generated if not provided)
+        reference: Reference text
+        delivery_address: Delivery address
+        attention_to: Attention to name
+        telephone: Contact telephone
+        delivery_instructions: Special delivery instructions
+        currency_code: Currency code (default AUD)
+        status: Initial status (DRAFT or SUBMITTED)
+
+    Returns:
+        Purchase order dictionary, with unset optional fields left out
+    """
+    purchase_order: dict[str, Any] = {
+        "Contact": {"ContactID": contact_id},
+        "LineItems": line_items,
+        "CurrencyCode": currency_code,
+        "Status": status,
+        "Date": date or _today(),
+    }
+    optional = {
+        "DeliveryDate": delivery_date,
+        "PurchaseOrderNumber": purchase_order_number,
+        "Reference": reference,
+        "DeliveryAddress": delivery_address,
+        "AttentionTo": attention_to,
+        "Telephone": telephone,
+        "DeliveryInstructions": delivery_instructions,
+    }
+    purchase_order.update({key: value for key, value in optional.items() if value})
+    return purchase_order
+
+
+class _TTLCache:
+    """Bounded LRU cache with optional per-entry expiry."""
+
+    def __init__(self, maxsize: int, ttl: float | None = None):
+        """Initialize cache.
+
+        Args:
+            maxsize: Maximum number of entries before the least recently used is evicted
+            ttl: Seconds before an entry expires (None for no expiry)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float | None, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Get a cached value, or None if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """Cache a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Seconds before this entry expires (defaults to the cache's ttl)
+        """
+        ttl = ttl if ttl is not None else self.ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def discard(self, key: Hashable) -> None:
+        """Remove an entry if present."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
 
 
 class XeroAPIError(Exception):
     """Xero API error."""
 
+    __slots__ = ("status_code", "details")
+
     def __init__(self, message: str, status_code: int | None = None, details: Any = None):
         super().__init__(message)
         self.status_code = status_code
         self.details = details
 
 
+class XeroBatchError(XeroAPIError):
+    """A batch write failed after earlier batches had already been applied."""
+
+    __slots__ = ("created",)
+
+    def __init__(
+        self,
+        message: str,
+        created: list[dict[str, Any]],
+        status_code: int | None = None,
+        details: Any = None,
+    ):
+        super().__init__(message, status_code=status_code, details=details)
+        self.created = created
+
+
 class XeroClient:
     """Wrapper around Xero API with rate limiting and automatic token refresh."""
 
+    __slots__ = (
+        "oauth",
+        "_session",
+        "_tokens",
+        "_last_refill",
+        "_rate_lock",
+        "_retry_after_at",
+        "_token_task",
+        "_inflight",
+        "_headers_key",
+        "_headers_get",
+        "_headers_post",
+        "_contact_cache",
+        "_record_cache",
+        "_po_meta_cache",
+        "_tenant_id",
+    )
+
     def __init__(self, oauth: XeroOAuth):
         """Initialize Xero client.
 
@@ -66,7 +351,248 @@ class XeroClient:
             oauth: OAuth handler for authentication
         """
         self.oauth = oauth
-        self._request_times: list[float] = []
+        self._session: aiohttp.ClientSession | None = None
+        # Token bucket rate limiter state
+        self._tokens = float(RATE_LIMIT_BURST)
+        self._last_refill = time.monotonic()
+        self._rate_lock = asyncio.Lock()
+        # Monotonic time before which no request may go out (set from 429s)
+        self._retry_after_at = 0.0
+        # Shared token lookup for concurrent requests (see _get_tokens)
+        self._token_task: asyncio.Task[TokenSet | None] | None = None
+        # (endpoint, id) -> in-flight GET shared by concurrent callers
+        self._inflight: dict[tuple[str, str], asyncio.Task[dict[str, Any]]] = {}
+        # JSON request headers, rebuilt only when the token or tenant changes
+        self._headers_key: tuple[str, str] | None = None
+        self._headers_get: dict[str, str] = {}
+        self._headers_post: dict[str, str] = {}
+        # (tenant_id, lower-cased name) -> contact
+        self._contact_cache = _TTLCache(CONTACT_CACHE_SIZE, ttl=CONTACT_CACHE_TTL)
+        # (endpoint, tenant_id, record id) -> GET response
+        self._record_cache = _TTLCache(RECORD_CACHE_SIZE)
+        # (tenant_id, purchase order id) -> (ContactID, YYYY-MM-DD date)
+        self._po_meta_cache = _TTLCache(PO_META_CACHE_SIZE, ttl=PO_META_CACHE_TTL)
+        # Active tenant as last seen in the tokens, used in cache keys (None if unknown)
+        self._tenant_id: str | None = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use.
+
+        Reusing one session keeps connections to api.xero.com alive between
+        requests instead of paying a TCP and TLS handshake on every call.
+
+        Returns:
+            Shared client session
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT),
+                # Sent on every request; callers add only auth and tenant headers
+                headers={"Accept": "application/json", "User-Agent": USER_AGENT},
+                # Xero sets no cookies we need, so skip the jar bookkeeping
+                cookie_jar=aiohttp.DummyCookieJar(),
+                connector=aiohttp.TCPConnector(
+                    limit=HTTP_CONNECTION_LIMIT,
+                    limit_per_host=HTTP_CONNECTION_LIMIT_PER_HOST,
+                    ttl_dns_cache=DNS_CACHE_TTL,
+                    keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+                ),
+            )
+        return self._session
+
+    async def _get_tokens(self) -> TokenSet | None:
+        """Get valid tokens, sharing one lookup between concurrent callers.
+
+        A burst of concurrent requests would otherwise each load the token
+        store and, if the token has expired, each trigger a re-authentication.
+
+        Returns:
+            Valid token set or None if not authenticated
+        """
+        task = self._token_task
+        if task is None:
+            task = asyncio.ensure_future(self.oauth.get_valid_tokens())
+            self._token_task = task
+
+            def _clear(done: asyncio.Task) -> None:
+                if self._token_task is done:
+                    self._token_task = None
+
+            task.add_done_callback(_clear)
+        # Shield so one cancelled caller doesn't cancel the lookup for the others
+        return await asyncio.shield(task)
+
+    def _json_headers(self, tokens: TokenSet, has_body: bool) -> dict[str, str]:
+        """Get JSON request headers for the current token and tenant.
+
+        The returned dict is shared between requests and must not be modified.
+
+        Args:
+            tokens: Valid token set
+            has_body: Whether the request sends a JSON body
+
+        Returns:
+            Request headers
+        """
+        key = (tokens.access_token, tokens.tenant_id or "")
+        if key != self._headers_key:
+            self._headers_get = {
+                "Authorization": f"Bearer {tokens.access_token}",
+                "xero-tenant-id": tokens.tenant_id or "",
+            }
+            self._headers_post = {**self._headers_get, "Content-Type": "application/json"}
+            self._headers_key = key
+        return self._headers_post if has_body else self._headers_get
+
+    async def _coalesced(
+        self,
+        key: tuple[str, str],
+        fetch: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        """Run a GET, sharing the result with concurrent callers for the same key.
+
+        Args:
+            key: (endpoint, id) identifying the resource
+            fetch: Zero-argument callable that performs the request
+
+        Returns:
+            Response data
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+
+            def _clear(done: asyncio.Task) -> None:
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+
+            task.add_done_callback(_clear)
+        return await asyncio.shield(task)
+
+    async def _fetch_pages(
+        self,
+        fetch_page: Callable[[int], Awaitable[list[dict[str, Any]]]],
+        pages: int,
+        first_page: int,
+    ) -> list[dict[str, Any]]:
+        """Fetch consecutive pages concurrently and concatenate them in page order.
+
+        Args:
+            fetch_page: Callable that fetches a single page by number
+            pages: Number of pages to fetch
+            first_page: First page number
+
+        Returns:
+            Records from all pages
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        async def fetch(page: int) -> list[dict[str, Any]]:
+            async with semaphore:
+                return await fetch_page(page)
+
+        results = await asyncio.gather(*(fetch(p) for p in range(first_page, first_page + pages)))
+        return list(chain.from_iterable(results))
+
+    async def _fetch_until_short_page(
+        self,
+        fetch_page: Callable[[int], Awaitable[list[dict[str, Any]]]],
+        max_concurrency: int,
+    ) -> list[dict[str, Any]]:
+        """Fetch every page of an endpoint whose page count isn't known up front.
+
+        Pages are fetched in concurrent waves that start at one page and
+        double up to max_concurrency, stopping at the first short page. A
+        small list costs no requests past its last page, and a long one
+        wastes at most one partial wave.
+
+        Args:
+            fetch_page: Callable that fetches a single page by number
+            max_concurrency: Largest number of pages fetched per wave
+
+        Returns:
+            Records from all pages, in page order
+        """
+        records: list[dict[str, Any]] = []
+        next_page = 1
+        wave = 1
+        while True:
+            batch = await self._fetch_pages(fetch_page, wave, next_page)
+            records.extend(batch)
+            # Every page but the last is full, so a short wave holds the last page
+            if len(batch) < wave * PAGE_SIZE:
+                return records
+            next_page += wave
+            wave = min(wave * 2, max_concurrency)
+
+    async def _get_record(self, endpoint: str, record_id: str) -> dict[str, Any]:
+        """GET a single record, served from the short-lived record cache when fresh.
+
+        Args:
+            endpoint: Collection endpoint (a key of RECORD_CACHE_TTL)
+            record_id: Record ID or number
+
+        Returns:
+            Response data
+        """
+        if self._tenant_id is not None:
+            cached = self._record_cache.get((endpoint, self._tenant_id, record_id))
+            if cached is not None:
+                return cached
+
+        response = await self._coalesced(
+            (endpoint, record_id),
+            lambda: self._request("GET", f"{endpoint}/{record_id}"),
+        )
+        # The request has recorded which tenant it was made for
+        self._record_cache.set(
+            (endpoint, self._tenant_id, record_id), response, ttl=RECORD_CACHE_TTL[endpoint]
+        )
+        return response
+
+    def _forget_record(self, endpoint: str, record_id: str) -> None:
+        """Drop a record from the record cache after it has been written.
+
+        Args:
+            endpoint: Collection endpoint
+            record_id: Record ID
+        """
+        self._record_cache.discard((endpoint, self._tenant_id, record_id))
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP session and its pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "XeroClient":
+        """Enter an async context; the session is closed on exit."""
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close the shared HTTP session."""
+        await self.aclose()
+
+    def reset_tenant(self) -> None:
+        """Forget the remembered tenant after the active tenant has changed.
+
+        Cached records are keyed by tenant, so until the next request reads
+        the new tenant from the token store every cache lookup misses.
+        """
+        self._tenant_id = None
+
+    def note_tenant(self, tenant_id: str | None) -> None:
+        """Record the active tenant from freshly loaded tokens.
+
+        Called before each tool call so cache lookups made before its first
+        request are keyed on the current tenant, even if the tokens were
+        re-issued for another tenant since the last request.
+
+        Args:
+            tenant_id: Active tenant ID from the token store
+        """
+        self._tenant_id = tenant_id or ""
 
     def _parse_error_message(self, error_text: str) -> str:
         """Parse Xero API error into readable message.
@@ -77,9 +603,12 @@ class XeroClient:
         Returns:
             Human-readable error message
         """
-        import json
+        # Xero's JSON errors are objects; skip parsing HTML gateway pages and plain text
+        if error_text[:1] != "{":
+            return f"Xero API error: {error_text[:200]}"
+
         try:
-            error_data = json.loads(error_text)
+            error_data = orjson.loads(error_text)
 
             # Handle validation exceptions
             if error_data.get("Type") == "ValidationException":
@@ -97,35 +626,172 @@ class XeroClient:
             if "Detail" in error_data:
                 return f"Xero error: {error_data['Detail']}"
 
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             pass
 
         return f"Xero API error: {error_text[:200]}"
 
     async def _check_rate_limit(self) -> None:
-        """Check and enforce rate limiting."""
-        now = datetime.now().timestamp()
-
-        # Enforce minimum interval between requests to avoid bursts
-        if self._request_times:
-            last_request = self._request_times[-1]
-            time_since_last = now - last_request
-            if time_since_last < MIN_REQUEST_INTERVAL:
-                wait_time = MIN_REQUEST_INTERVAL - time_since_last
-                await asyncio.sleep(wait_time)
-                now = datetime.now().timestamp()
+        """Check and enforce rate limiting.
 
-        # Remove old requests outside the window
-        self._request_times = [t for t in self._request_times if now - t < RATE_LIMIT_WINDOW]
-
-        # If at limit, wait
-        if len(self._request_times) >= RATE_LIMIT_REQUESTS:
-            wait_time = RATE_LIMIT_WINDOW - (now - self._request_times[0])
-            if wait_time > 0:
+        Token bucket: up to RATE_LIMIT_BURST requests go out immediately, after
+        which tokens refill at RATE_LIMIT_REQUESTS per RATE_LIMIT_WINDOW.
+        While a Retry-After from a 429 is in force every request waits it out,
+        so concurrent calls back off together instead of each hitting a 429.
+        """
+        # Serialize waiters so each one sleeps for its own token
+        async with self._rate_lock:
+            # Re-check after sleeping in case another 429 pushed the gate out
+            while (pause := self._retry_after_at - time.monotonic()) > 0:
+                await asyncio.sleep(pause)
+            now = time.monotonic()
+            refill_rate = RATE_LIMIT_REQUESTS / RATE_LIMIT_WINDOW
+            refilled = self._tokens + (now - self._last_refill) * refill_rate
+            self._tokens = min(RATE_LIMIT_BURST, refilled)
+            self._last_refill = now
+
+            if self._tokens < 1:
+                wait_time = (1 - self._tokens) / refill_rate
                 logger.info(f"Rate limit reached, waiting {wait_time:.1f}s")
                 await asyncio.sleep(wait_time)
+                self._tokens = 0.0
+                self._last_refill = time.monotonic()
+            else:
+                self._tokens -= 1
+
+    async def _acquire_request_slot(self) -> TokenSet:
+        """Wait for a rate-limit token while fetching valid auth tokens.
+
+        The token lookup (and any re-authentication) runs during the
+        rate-limit wait instead of before it.
+
+        Returns:
+            Valid token set
+
+        Raises:
+            XeroAPIError: If not authenticated
+        """
+        token_task = asyncio.ensure_future(self._get_tokens())
+        try:
+            await self._check_rate_limit()
+        except BaseException:
+            token_task.cancel()
+            raise
+        tokens = await token_task
+        if not tokens:
+            raise XeroAPIError("Not authenticated with Xero", status_code=401)
+        self._tenant_id = tokens.tenant_id or ""
+        return tokens
+
+    def _sync_rate_limit(self, response: aiohttp.ClientResponse) -> None:
+        """Lower the local token bucket to Xero's reported per-minute allowance.
+
+        Keeps the limiter honest when other clients share the tenant's quota.
+
+        Args:
+            response: Xero API response
+        """
+        remaining = response.headers.get("X-MinLimit-Remaining")
+        if remaining is not None and remaining.isdigit():
+            self._tokens = min(self._tokens, float(remaining))
 
-        self._request_times.append(now)
+    def _retry_after_delay(self, response: aiohttp.ClientResponse, attempt: int) -> float:
+        """Get how long to wait after a 429 response.
+
+        Uses Retry-After plus jitter so concurrent waiters don't wake together,
+        falling back to exponential backoff when the header is missing.
+
+        Args:
+            response: 429 response from Xero
+            attempt: Zero-based count of 429 retries so far
+
+        Returns:
+            Delay in seconds
+        """
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is None or not retry_after.isdigit():
+            return _backoff_delay(attempt)
+        return int(retry_after) * (1 + random.random() * RATE_LIMIT_RETRY_JITTER)
+
+    async def _request_with_backoff(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        idempotency_key: str | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Send a request, retrying on rate limits and transient failures.
+
+        429 responses are always retried, up to RATE_LIMIT_MAX_RETRIES
+        attempts. Connection errors, timeouts and 5xx responses are retried
+        with exponential backoff, up to RETRY_MAX_ATTEMPTS attempts, for
+        idempotent methods or writes that carry an idempotency key, so a
+        create is never applied twice. The two budgets are counted
+        separately. Other errors raise immediately.
+
+        Args:
+            method: HTTP method
+            url: Full request URL
+            headers: Request headers (not modified)
+            idempotency_key: Idempotency-Key header value, reused on every attempt
+            **kwargs: Passed through to ClientSession.request (data, params, timeout)
+
+        Returns:
+            Response data
+
+        Raises:
+            XeroAPIError: If the request fails or retries are exhausted
+        """
+        retry_transient = method in IDEMPOTENT_METHODS or idempotency_key is not None
+        if idempotency_key is not None:
+            headers = {**headers, "Idempotency-Key": idempotency_key}
+        session = await self._get_session()
+        # Retries so far for each budget
+        rate_limited = 0
+        failures = 0
+        while True:
+            if rate_limited or failures:
+                # Retries are real requests and spend rate-limit tokens too
+                await self._check_rate_limit()
+            can_retry_failure = retry_transient and failures < RETRY_MAX_ATTEMPTS - 1
+            try:
+                async with session.request(method, url, headers=headers, **kwargs) as response:
+                    self._sync_rate_limit(response)
+                    if response.status == 429:
+                        if rate_limited == RATE_LIMIT_MAX_RETRIES - 1:
+                            raise XeroAPIError("Max retries exceeded", status_code=429)
+                        delay = self._retry_after_delay(response, rate_limited)
+                        rate_limited += 1
+                        # Hold back every other request for the same window
+                        self._retry_after_at = max(self._retry_after_at, time.monotonic() + delay)
+                        logger.warning(f"Rate limited, retrying after {delay:.1f}s")
+                    elif response.status >= 500 and can_retry_failure:
+                        delay = _backoff_delay(failures)
+                        failures += 1
+                        logger.warning(
+                            f"Xero returned {response.status}, retrying after {delay:.1f}s"
+                        )
+                    elif response.status >= 400:
+                        error_text = await response.text()
+                        # Try to parse validation errors into readable format
+                        user_message = self._parse_error_message(error_text)
+                        raise XeroAPIError(
+                            user_message,
+                            status_code=response.status,
+                            details=error_text,
+                        )
+                    else:
+                        # orjson parses large list payloads considerably faster than stdlib json
+                        body = await response.read()
+                        return orjson.loads(body) if body else {}
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if not can_retry_failure:
+                    raise XeroAPIError(f"Could not reach Xero: {e!r}") from e
+                delay = _backoff_delay(failures)
+                failures += 1
+                logger.warning(f"Request to Xero failed ({e!r}), retrying after {delay:.1f}s")
+            await asyncio.sleep(delay)
 
     async def _request(
         self,
@@ -133,6 +799,7 @@ class XeroClient:
         endpoint: str,
         data: dict | None = None,
         params: dict | None = None,
+        idempotency_key: str | None = None,
     ) -> dict[str, Any]:
         """Make authenticated request to Xero API.
 
@@ -141,6 +808,7 @@ class XeroClient:
             endpoint: API endpoint (without base URL)
             data: Request body data
             params: Query parameters
+            idempotency_key: Sent as Idempotency-Key so a write can be retried safely
 
         Returns:
             Response data
@@ -148,52 +816,16 @@ class XeroClient:
         Raises:
             XeroAPIError: If request fails
         """
-        tokens = await self.oauth.get_valid_tokens()
-        if not tokens:
-            raise XeroAPIError("Not authenticated with Xero", status_code=401)
-
-        await self._check_rate_limit()
+        tokens = await self._acquire_request_slot()
 
         url = f"{XERO_API_BASE}/{endpoint}"
-        headers = {
-            "Authorization": f"Bearer {tokens.access_token}",
-            "xero-tenant-id": tokens.tenant_id or "",
-            "Accept": "application/json",
-        }
-
-        if data:
-            headers["Content-Type"] = "application/json"
-
-        async with aiohttp.ClientSession() as session:
-            for attempt in range(3):  # Retry up to 3 times
-                async with session.request(
-                    method,
-                    url,
-                    json=data,
-                    params=params,
-                    headers=headers,
-                ) as response:
-                    # Handle rate limiting
-                    if response.status == 429:
-                        retry_after = int(response.headers.get("Retry-After", 60))
-                        logger.warning(f"Rate limited, retrying after {retry_after}s")
-                        await asyncio.sleep(retry_after)
-                        continue
+        headers = self._json_headers(tokens, data is not None)
+        # orjson encodes the body considerably faster than aiohttp's stdlib json
+        body = orjson.dumps(data) if data is not None else None
 
-                    # Handle other errors
-                    if response.status >= 400:
-                        error_text = await response.text()
-                        # Try to parse validation errors into readable format
-                        user_message = self._parse_error_message(error_text)
-                        raise XeroAPIError(
-                            user_message,
-                            status_code=response.status,
-                            details=error_text,
-                        )
-
-                    return await response.json()
-
-            raise XeroAPIError("Max retries exceeded", status_code=429)
+        return await self._request_with_backoff(
+            method, url, headers, idempotency_key=idempotency_key, data=body, params=params
+        )
 
     async def _request_attachment(
         self,
@@ -216,17 +848,12 @@ class XeroClient:
         Raises:
             XeroAPIError: If request fails
         """
-        tokens = await self.oauth.get_valid_tokens()
-        if not tokens:
-            raise XeroAPIError("Not authenticated with Xero", status_code=401)
-
-        await self._check_rate_limit()
+        tokens = await self._acquire_request_slot()
 
         url = f"{XERO_API_BASE}/{endpoint}"
         headers = {
             "Authorization": f"Bearer {tokens.access_token}",
             "xero-tenant-id": tokens.tenant_id or "",
-            "Accept": "application/json",
         }
 
         data = None
@@ -243,32 +870,13 @@ class XeroClient:
             headers["Content-Type"] = content_type
             data = file_path.read_bytes()
 
-        async with aiohttp.ClientSession() as session:
-            for attempt in range(3):
-                async with session.request(
-                    method,
-                    url,
-                    data=data,
-                    headers=headers,
-                ) as response:
-                    if response.status == 429:
-                        retry_after = int(response.headers.get("Retry-After", 60))
-                        logger.warning(f"Rate limited, retrying after {retry_after}s")
-                        await asyncio.sleep(retry_after)
-                        continue
-
-                    if response.status >= 400:
-                        error_text = await response.text()
-                        user_message = self._parse_error_message(error_text)
-                        raise XeroAPIError(
-                            user_message,
-                            status_code=response.status,
-                            details=error_text,
-                        )
-
-                    return await response.json()
-
-            raise XeroAPIError("Max retries exceeded", status_code=429)
+        return await self._request_with_backoff(
+            method,
+            url,
+            headers,
+            data=data,
+            timeout=aiohttp.ClientTimeout(total=ATTACHMENT_TIMEOUT),
+        )
 
     # ==================== Contacts ====================
 
@@ -309,7 +917,7 @@ class XeroClient:
         Returns:
             Contact details
         """
-        response = await self._request("GET", f"Contacts/{contact_id}")
+        response = await self._get_record("Contacts", contact_id)
         contacts = response.get("Contacts", [])
         if not contacts:
             raise XeroAPIError(f"Contact not found: {contact_id}", status_code=404)
@@ -335,14 +943,23 @@ class XeroClient:
         Returns:
             Contact if found, None otherwise
         """
+        if self._tenant_id is not None:
+            cached = self._contact_cache.get((self._tenant_id, name.lower()))
+            if cached is not None:
+                return cached
+
         contacts = await self.search_contacts(name)
         if not contacts:
             return None
         # Return exact match if found, otherwise first partial match
+        match = contacts[0]
         for contact in contacts:
             if contact.get("Name", "").lower() == name.lower():
-                return contact
-        return contacts[0]
+                match = contact
+                break
+        # The search has recorded which tenant it was made for
+        self._contact_cache.set((self._tenant_id, name.lower()), match)
+        return match
 
     async def create_contact(
         self,
@@ -380,6 +997,8 @@ class XeroClient:
             contact["AccountNumber"] = account_number
 
         response = await self._request("POST", "Contacts", data={"Contacts": [contact]})
+        # A new contact may now be the best match for a cached name lookup
+        self._contact_cache.clear()
         return response.get("Contacts", [{}])[0]
 
     # ==================== Quotes ====================
@@ -409,28 +1028,32 @@ class XeroClient:
             List of quotes
         """
         params: dict[str, Any] = {"page": page}
-        where_clauses = []
-
-        if status:
-            where_clauses.append(f'Status=="{status}"')
-        if contact_id:
-            where_clauses.append(f'Contact.ContactID==Guid("{contact_id}")')
-        if contact_name:
-            # Use Contains for partial name matching
-            where_clauses.append(f'Contact.Name.Contains("{contact_name}")')
-        if date_from:
-            where_clauses.append(f'Date>=DateTime({date_from.replace("-", ",")})')
-        if date_to:
-            where_clauses.append(f'Date<=DateTime({date_to.replace("-", ",")})')
-        if where:
-            where_clauses.append(where)
-
-        if where_clauses:
-            params["where"] = " AND ".join(where_clauses)
+        where_clause = _build_where(status, contact_id, contact_name, date_from, date_to, where)
+        if where_clause:
+            params["where"] = where_clause
 
         response = await self._request("GET", "Quotes", params=params)
         return response.get("Quotes", [])
 
+    async def list_quote_pages(
+        self, pages: int = 5, first_page: int = 1, **filters: Any
+    ) -> list[dict[str, Any]]:
+        """List several pages of quotes concurrently.
+
+        Args:
+            pages: Number of pages to fetch
+            first_page: First page number
+            **filters: Filters accepted by list_quotes (other than page)
+
+        Returns:
+            List of quotes from all fetched pages, in page order
+        """
+        return await self._fetch_pages(
+            lambda page: self.list_quotes(page=page, **filters),
+            pages,
+            first_page,
+        )
+
     async def get_quote(self, quote_id: str) -> dict[str, Any]:
         """Get quote by ID.
 
@@ -440,7 +1063,7 @@ class XeroClient:
         Returns:
             Quote details
         """
-        response = await self._request("GET", f"Quotes/{quote_id}")
+        response = await self._get_record("Quotes", quote_id)
         quotes = response.get("Quotes", [])
         if not quotes:
             raise XeroAPIError(f"Quote not found: {quote_id}", status_code=404)
@@ -489,7 +1112,7 @@ class XeroClient:
             "LineItems": processed_line_items,
             "CurrencyCode": currency_code,
             "Status": "DRAFT",
-            "Date": date or datetime.now().strftime("%Y-%m-%d"),
+            "Date": date or _today(),
         }
         if expiry_date:
             quote["ExpiryDate"] = expiry_date
@@ -562,7 +1185,7 @@ class XeroClient:
         quote: dict[str, Any] = {
             "QuoteID": quote_id,
             "Contact": {"ContactID": existing["Contact"]["ContactID"]},
-            "Date": existing.get("DateString", "")[:10] if existing.get("DateString") else datetime.now().strftime("%Y-%m-%d"),
+            "Date": existing.get("DateString", "")[:10] if existing.get("DateString") else _today(),
         }
 
         # Only include fields that are being updated or need to be preserved
@@ -589,6 +1212,7 @@ class XeroClient:
             quote["Summary"] = summary
 
         response = await self._request("POST", "Quotes", data={"Quotes": [quote]})
+        self._forget_record("Quotes", quote_id)
         return response.get("Quotes", [{}])[0]
 
     async def send_quote(self, quote_id: str) -> dict[str, Any]:
@@ -630,6 +1254,7 @@ class XeroClient:
             f"Quotes/{quote_id}/Attachments/{filename}",
             file_path=file_path,
         )
+        self._forget_record("Quotes", quote_id)
         return response.get("Attachments", [{}])[0]
 
     async def list_quote_attachments(self, quote_id: str) -> list[dict[str, Any]]:
@@ -673,27 +1298,38 @@ class XeroClient:
             List of invoices
         """
         params: dict[str, Any] = {"page": page}
-        where_clauses = [f'Type=="{invoice_type}"']
-
-        if status:
-            where_clauses.append(f'Status=="{status}"')
-        if contact_id:
-            where_clauses.append(f'Contact.ContactID==Guid("{contact_id}")')
-        if contact_name:
-            # Use Contains for partial name matching
-            where_clauses.append(f'Contact.Name.Contains("{contact_name}")')
-        if date_from:
-            where_clauses.append(f'Date>=DateTime({date_from.replace("-", ",")})')
-        if date_to:
-            where_clauses.append(f'Date<=DateTime({date_to.replace("-", ",")})')
-        if where:
-            where_clauses.append(where)
-
-        params["where"] = " AND ".join(where_clauses)
+        params["where"] = _build_where(
+            status,
+            contact_id,
+            contact_name,
+            date_from,
+            date_to,
+            where,
+            base=f'Type=="{invoice_type}"',
+        )
 
         response = await self._request("GET", "Invoices", params=params)
         return response.get("Invoices", [])
 
+    async def list_invoice_pages(
+        self, pages: int = 5, first_page: int = 1, **filters: Any
+    ) -> list[dict[str, Any]]:
+        """List several pages of invoices concurrently.
+
+        Args:
+            pages: Number of pages to fetch
+            first_page: First page number
+            **filters: Filters accepted by list_invoices (other than page)
+
+        Returns:
+            List of invoices from all fetched pages, in page order
+        """
+        return await self._fetch_pages(
+            lambda page: self.list_invoices(page=page, **filters),
+            pages,
+            first_page,
+        )
+
     async def get_invoice(self, invoice_id: str) -> dict[str, Any]:
         """Get invoice by ID.
 
@@ -703,7 +1339,7 @@ class XeroClient:
         Returns:
             Invoice details
         """
-        response = await self._request("GET", f"Invoices/{invoice_id}")
+        response = await self._get_record("Invoices", invoice_id)
         invoices = response.get("Invoices", [])
         if not invoices:
             raise XeroAPIError(f"Invoice not found: {invoice_id}", status_code=404)
@@ -751,7 +1387,7 @@ class XeroClient:
             "LineItems": processed_line_items,
             "CurrencyCode": currency_code,
             "Status": status,
-            "Date": date or datetime.now().strftime("%Y-%m-%d"),
+            "Date": date or _today(),
         }
         if due_date:
             invoice["DueDate"] = due_date
@@ -813,7 +1449,7 @@ class XeroClient:
             "InvoiceID": invoice_id,
             "Type": existing.get("Type"),
             "Contact": {"ContactID": existing["Contact"]["ContactID"]},
-            "Date": existing.get("DateString", "")[:10] if existing.get("DateString") else datetime.now().strftime("%Y-%m-%d"),
+            "Date": existing.get("DateString", "")[:10] if existing.get("DateString") else _today(),
         }
 
         # Only include fields that are being updated
@@ -830,7 +1466,22 @@ class XeroClient:
         if reference is not None:
             invoice["Reference"] = reference
 
+        return await self._update_invoice_raw(invoice)
+
+    async def _update_invoice_raw(self, invoice: dict[str, Any]) -> dict[str, Any]:
+        """POST an invoice update payload as-is, without fetching the invoice first.
+
+        Xero accepts status-only payloads ({"InvoiceID": ..., "Status": ...})
+        for existing invoices.
+
+        Args:
+            invoice: Invoice payload including InvoiceID
+
+        Returns:
+            Updated invoice
+        """
         response = await self._request("POST", "Invoices", data={"Invoices": [invoice]})
+        self._forget_record("Invoices", invoice["InvoiceID"])
         return response.get("Invoices", [{}])[0]
 
     async def void_invoice(self, invoice_id: str) -> dict[str, Any]:
@@ -845,7 +1496,7 @@ class XeroClient:
         Returns:
             Voided invoice
         """
-        return await self.update_invoice(invoice_id, status="VOIDED")
+        return await self._update_invoice_raw({"InvoiceID": invoice_id, "Status": "VOIDED"})
 
     async def delete_invoice(self, invoice_id: str) -> dict[str, Any]:
         """Delete a draft invoice.
@@ -868,11 +1519,7 @@ class XeroClient:
             )
 
         # Update to DELETED status
-        invoice_data: dict[str, Any] = {
-            "InvoiceID": invoice_id,
-            "Status": "DELETED",
-        }
-        response = await self._request("POST", "Invoices", data={"Invoices": [invoice_data]})
+        await self._update_invoice_raw({"InvoiceID": invoice_id, "Status": "DELETED"})
         return {"success": True, "message": f"Invoice {invoice.get('InvoiceNumber')} deleted"}
 
     async def send_invoice(self, invoice_id: str) -> dict[str, Any]:
@@ -887,6 +1534,7 @@ class XeroClient:
             Email send status
         """
         response = await self._request("POST", f"Invoices/{invoice_id}/Email")
+        self._forget_record("Invoices", invoice_id)
         return response
 
     async def upload_invoice_attachment(
@@ -914,6 +1562,7 @@ class XeroClient:
             f"Invoices/{invoice_id}/Attachments/{filename}",
             file_path=file_path,
         )
+        self._forget_record("Invoices", invoice_id)
         return response.get("Attachments", [{}])[0]
 
     async def list_invoice_attachments(self, invoice_id: str) -> list[dict[str, Any]]:
@@ -946,19 +1595,54 @@ class XeroClient:
                 status_code=400,
             )
 
-        # Create invoice from quote
-        invoice = await self.create_invoice(
-            contact_id=quote["Contact"]["ContactID"],
-            line_items=quote["LineItems"],
-            reference=f"Quote {quote.get('QuoteNumber', quote_id)}",
-            currency_code=quote.get("CurrencyCode", "AUD"),
+        # Create the invoice and mark the quote as invoiced concurrently
+        invoice, marked = await asyncio.gather(
+            self.create_invoice(
+                contact_id=quote["Contact"]["ContactID"],
+                line_items=quote["LineItems"],
+                reference=f"Quote {quote.get('QuoteNumber', quote_id)}",
+                currency_code=quote.get("CurrencyCode", "AUD"),
+            ),
+            self._set_quote_status(quote, "INVOICED"),
+            return_exceptions=True,
         )
 
-        # Mark quote as invoiced
-        await self.update_quote(quote_id, status="INVOICED")
+        if isinstance(invoice, BaseException):
+            if not isinstance(marked, BaseException):
+                # Roll the quote back so the conversion can be retried
+                try:
+                    await self._set_quote_status(quote, "ACCEPTED")
+                except XeroAPIError as e:
+                    logger.warning(f"Failed to revert quote {quote_id} to ACCEPTED: {e}")
+            raise invoice
+        if isinstance(marked, BaseException):
+            raise marked
 
         return invoice
 
+    async def _set_quote_status(self, quote: dict[str, Any], status: str) -> dict[str, Any]:
+        """Change a quote's status using already-fetched quote data.
+
+        Unlike update_quote, this does not re-fetch the quote to recover its
+        required Contact and Date fields.
+
+        Args:
+            quote: Quote as returned by get_quote
+            status: New status
+
+        Returns:
+            Updated quote
+        """
+        payload: dict[str, Any] = {
+            "QuoteID": quote["QuoteID"],
+            "Contact": {"ContactID": quote["Contact"]["ContactID"]},
+            "Date": quote.get("DateString", "")[:10] if quote.get("DateString") else _today(),
+            "Status": status,
+        }
+        response = await self._request("POST", "Quotes", data={"Quotes": [payload]})
+        self._forget_record("Quotes", quote["QuoteID"])
+        return response.get("Quotes", [{}])[0]
+
     # ==================== Purchase Orders ====================
 
     async def list_purchase_orders(
@@ -986,28 +1670,32 @@ class XeroClient:
             List of purchase orders
         """
         params: dict[str, Any] = {"page": page}
-        where_clauses = []
-
-        if status:
-            where_clauses.append(f'Status=="{status}"')
-        if contact_id:
-            where_clauses.append(f'Contact.ContactID==Guid("{contact_id}")')
-        if contact_name:
-            # Use Contains for partial name matching
-            where_clauses.append(f'Contact.Name.Contains("{contact_name}")')
-        if date_from:
-            where_clauses.append(f'Date>=DateTime({date_from.replace("-", ",")})')
-        if date_to:
-            where_clauses.append(f'Date<=DateTime({date_to.replace("-", ",")})')
-        if where:
-            where_clauses.append(where)
-
-        if where_clauses:
-            params["where"] = " AND ".join(where_clauses)
+        where_clause = _build_where(status, contact_id, contact_name, date_from, date_to, where)
+        if where_clause:
+            params["where"] = where_clause
 
         response = await self._request("GET", "PurchaseOrders", params=params)
         return response.get("PurchaseOrders", [])
 
+    async def list_purchase_order_pages(
+        self, pages: int = 5, first_page: int = 1, **filters: Any
+    ) -> list[dict[str, Any]]:
+        """List several pages of purchase orders concurrently.
+
+        Args:
+            pages: Number of pages to fetch
+            first_page: First page number
+            **filters: Filters accepted by list_purchase_orders (other than page)
+
+        Returns:
+            List of purchase orders from all fetched pages, in page order
+        """
+        return await self._fetch_pages(
+            lambda page: self.list_purchase_orders(page=page, **filters),
+            pages,
+            first_page,
+        )
+
     async def get_purchase_order(self, purchase_order_id: str) -> dict[str, Any]:
         """Get purchase order by ID.
 
@@ -1017,7 +1705,10 @@ class XeroClient:
         Returns:
             Purchase order details
         """
-        response = await self._request("GET", f"PurchaseOrders/{purchase_order_id}")
+        response = await self._coalesced(
+            ("PurchaseOrders", purchase_order_id),
+            lambda: self._request("GET", f"PurchaseOrders/{purchase_order_id}"),
+        )
         purchase_orders = response.get("PurchaseOrders", [])
         if not purchase_orders:
             raise XeroAPIError(f"Purchase order not found: {purchase_order_id}", status_code=404)
@@ -1062,30 +1753,85 @@ class XeroClient:
         Returns:
             Created purchase order
         """
-        purchase_order: dict[str, Any] = {
-            "Contact": {"ContactID": contact_id},
-            "LineItems": line_items,
-            "CurrencyCode": currency_code,
-            "Status": status,
-            "Date": date or datetime.now().strftime("%Y-%m-%d"),
-        }
-        if delivery_date:
-            purchase_order["DeliveryDate"] = delivery_date
-        if purchase_order_number:
-            purchase_order["PurchaseOrderNumber"] = purchase_order_number
-        if reference:
-            purchase_order["Reference"] = reference
-        if delivery_address:
-            purchase_order["DeliveryAddress"] = delivery_address
-        if attention_to:
-            purchase_order["AttentionTo"] = attention_to
-        if telephone:
-            purchase_order["Telephone"] = telephone
-        if delivery_instructions:
-            purchase_order["DeliveryInstructions"] = delivery_instructions
-
-        response = await self._request("POST", "PurchaseOrders", data={"PurchaseOrders": [purchase_order]})
-        return response.get("PurchaseOrders", [{}])[0]
+        created = await self.create_purchase_orders(
+            [
+                {
+                    "contact_id": contact_id,
+                    "line_items": line_items,
+                    "date": date,
+                    "delivery_date": delivery_date,
+                    "purchase_order_number": purchase_order_number,
+                    "reference": reference,
+                    "delivery_address": delivery_address,
+                    "attention_to": attention_to,
+                    "telephone": telephone,
+                    "delivery_instructions": delivery_instructions,
+                    "currency_code": currency_code,
+                    "status": status,
+                }
+            ]
+        )
+        return created[0] if created else {}
+
+    async def create_purchase_orders(self, orders: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Create several purchase orders, up to PO_BATCH_SIZE per request.
+
+        Xero validates each request as a whole, so one invalid order fails
+        the batch it was sent in. Batches are sent in order and stop at the
+        first failure: earlier ones stay created, and the error lists them
+        along with the range of orders (the failed batch onwards) not sent.
+
+        Args:
+            orders: Purchase orders, each a dict of create_purchase_order
+                keyword arguments (contact_id and line_items required)
+
+        Returns:
+            Created purchase orders, in the order given
+
+        Raises:
+            XeroAPIError: If the first batch fails (nothing was created)
+            XeroBatchError: If a later batch fails; its created attribute
+                holds the purchase orders from the batches that succeeded
+        """
+        created: list[dict[str, Any]] = []
+        for start in range(0, len(orders), PO_BATCH_SIZE):
+            batch = orders[start : start + PO_BATCH_SIZE]
+            try:
+                # One key per logical create, so retries can't create duplicate POs
+                response = await self._request(
+                    "POST",
+                    "PurchaseOrders",
+                    data={"PurchaseOrders": [_build_po_payload(**order) for order in batch]},
+                    idempotency_key=uuid.uuid4().hex,
+                )
+            except XeroAPIError as e:
+                if not created:
+                    raise
+                numbers = ", ".join(po.get("PurchaseOrderNumber") or "?" for po in created)
+                raise XeroBatchError(
+                    f"{e} (orders {start + 1}-{len(orders)} not created; "
+                    f"{len(created)} already created: {numbers})",
+                    created,
+                    status_code=e.status_code,
+                    details=e.details,
+                ) from e
+            for purchase_order in response.get("PurchaseOrders", []):
+                self._remember_po_meta(self._tenant_id, purchase_order)
+                created.append(purchase_order)
+        return created
+
+    def _remember_po_meta(self, tenant_id: str, purchase_order: dict[str, Any]) -> None:
+        """Cache the fields a purchase order update must resend.
+
+        Args:
+            tenant_id: Tenant the purchase order belongs to
+            purchase_order: Purchase order as returned by Xero
+        """
+        po_id = purchase_order.get("PurchaseOrderID")
+        contact_id = purchase_order.get("Contact", {}).get("ContactID")
+        date = (purchase_order.get("DateString") or "")[:10]
+        if po_id and contact_id and date:
+            self._po_meta_cache.set((tenant_id, po_id), (contact_id, date))
 
     async def update_purchase_order(
         self,
@@ -1111,36 +1857,48 @@ class XeroClient:
         Returns:
             Updated purchase order
         """
-        # Fetch existing PO to preserve required fields
-        existing = await self.get_purchase_order(purchase_order_id)
+        # Required fields come from the metadata cache, or from the existing PO on a miss
+        meta = None
+        if self._tenant_id is not None:
+            meta = self._po_meta_cache.get((self._tenant_id, purchase_order_id))
+        if meta is None:
+            existing = await self.get_purchase_order(purchase_order_id)
+            meta = (
+                existing["Contact"]["ContactID"],
+                existing.get("DateString", "")[:10] if existing.get("DateString") else _today(),
+            )
+        contact_id, po_date = meta
 
         # Build update payload with required fields
         purchase_order: dict[str, Any] = {
             "PurchaseOrderID": purchase_order_id,
-            "Contact": {"ContactID": existing["Contact"]["ContactID"]},
-            "Date": existing.get("DateString", "")[:10] if existing.get("DateString") else datetime.now().strftime("%Y-%m-%d"),
+            "Contact": {"ContactID": contact_id},
+            "Date": po_date,
         }
 
-        if status:
-            purchase_order["Status"] = status
-
-        if line_items is not None:
-            purchase_order["LineItems"] = line_items
-
-        if delivery_date:
-            purchase_order["DeliveryDate"] = delivery_date
-
-        if reference is not None:
-            purchase_order["Reference"] = reference
-
-        if delivery_address is not None:
-            purchase_order["DeliveryAddress"] = delivery_address
-
-        if attention_to is not None:
-            purchase_order["AttentionTo"] = attention_to
+        # Status and delivery date are only sent when set; the rest may be cleared with ""
+        if_set = {"Status": status, "DeliveryDate": delivery_date}
+        if_given = {
+            "LineItems": line_items,
+            "Reference": reference,
+            "DeliveryAddress": delivery_address,
+            "AttentionTo": attention_to,
+        }
+        purchase_order.update({key: value for key, value in if_set.items() if value})
+        purchase_order.update({key: value for key, value in if_given.items() if value is not None})
 
-        response = await self._request("POST", "PurchaseOrders", data={"PurchaseOrders": [purchase_order]})
-        return response.get("PurchaseOrders", [{}])[0]
+        try:
+            response = await self._request(
+                "POST", "PurchaseOrders", data={"PurchaseOrders": [purchase_order]}
+            )
+        except XeroAPIError as e:
+            # A rejected update may mean the cached fields are stale
+            if e.status_code is not None and 400 <= e.status_code < 500:
+                self._po_meta_cache.discard((self._tenant_id, purchase_order_id))
+            raise
+        updated = response.get("PurchaseOrders", [{}])[0]
+        self._remember_po_meta(self._tenant_id, updated)
+        return updated
 
     # ==================== Payroll AU ====================
 
@@ -1150,6 +1908,7 @@ class XeroClient:
         endpoint: str,
         data: dict | None = None,
         params: dict | None = None,
+        idempotency_key: str | None = None,
     ) -> dict[str, Any]:
         """Make authenticated request to Xero Payroll AU API.
 
@@ -1158,6 +1917,7 @@ class XeroClient:
             endpoint: API endpoint (without base URL)
             data: Request body data
             params: Query parameters
+            idempotency_key: Sent as Idempotency-Key so a write can be retried safely
 
         Returns:
             Response data
@@ -1165,51 +1925,16 @@ class XeroClient:
         Raises:
             XeroAPIError: If request fails
         """
-        tokens = await self.oauth.get_valid_tokens()
-        if not tokens:
-            raise XeroAPIError("Not authenticated with Xero", status_code=401)
-
-        await self._check_rate_limit()
+        tokens = await self._acquire_request_slot()
 
         url = f"{XERO_PAYROLL_AU_BASE}/{endpoint}"
-        headers = {
-            "Authorization": f"Bearer {tokens.access_token}",
-            "xero-tenant-id": tokens.tenant_id or "",
-            "Accept": "application/json",
-        }
-
-        if data:
-            headers["Content-Type"] = "application/json"
-
-        async with aiohttp.ClientSession() as session:
-            for attempt in range(3):  # Retry up to 3 times
-                async with session.request(
-                    method,
-                    url,
-                    json=data,
-                    params=params,
-                    headers=headers,
-                ) as response:
-                    # Handle rate limiting
-                    if response.status == 429:
-                        retry_after = int(response.headers.get("Retry-After", 60))
-                        logger.warning(f"Rate limited, retrying after {retry_after}s")
-                        await asyncio.sleep(retry_after)
-                        continue
-
-                    # Handle other errors
-                    if response.status >= 400:
-                        error_text = await response.text()
-                        user_message = self._parse_error_message(error_text)
-                        raise XeroAPIError(
-                            user_message,
-                            status_code=response.status,
-                            details=error_text,
-                        )
-
-                    return await response.json()
+        headers = self._json_headers(tokens, data is not None)
+        # orjson encodes the body considerably faster than aiohttp's stdlib json
+        body = orjson.dumps(data) if data is not None else None
 
-            raise XeroAPIError("Max retries exceeded", status_code=429)
+        return await self._request_with_backoff(
+            method, url, headers, idempotency_key=idempotency_key, data=body, params=params
+        )
 
     async def list_payruns(
         self,
@@ -1233,6 +1958,25 @@ class XeroClient:
         response = await self._payroll_request("GET", "PayRuns", params=params)
         return response.get("PayRuns", [])
 
+    async def list_all_payruns(
+        self,
+        status: str | None = None,
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+    ) -> list[dict[str, Any]]:
+        """List pay runs across all pages, fetching pages after the first concurrently.
+
+        Args:
+            status: Filter by status (DRAFT, POSTED)
+            max_concurrency: Maximum pages fetched at once
+
+        Returns:
+            List of all pay runs
+        """
+        return await self._fetch_until_short_page(
+            lambda page: self.list_payruns(status=status, page=page),
+            max_concurrency,
+        )
+
     async def get_payrun(self, payrun_id: str) -> dict[str, Any]:
         """Get pay run by ID with full details including payslips.
 
@@ -1242,7 +1986,10 @@ class XeroClient:
         Returns:
             Pay run details with payslips
         """
-        response = await self._payroll_request("GET", f"PayRuns/{payrun_id}")
+        response = await self._coalesced(
+            ("PayRuns", payrun_id),
+            lambda: self._payroll_request("GET", f"PayRuns/{payrun_id}"),
+        )
         payruns = response.get("PayRuns", [])
         if not payruns:
             raise XeroAPIError(f"Pay run not found: {payrun_id}", status_code=404)
@@ -1269,3 +2016,22 @@ class XeroClient:
 
         response = await self._payroll_request("GET", "Employees", params=params)
         return response.get("Employees", [])
+
+    async def list_all_payroll_employees(
+        self,
+        status: str | None = None,
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+    ) -> list[dict[str, Any]]:
+        """List payroll employees across all pages, fetching pages after the first concurrently.
+
+        Args:
+            status: Filter by status (ACTIVE, TERMINATED)
+            max_concurrency: Maximum pages fetched at once
+
+        Returns:
+            List of all payroll employees
+        """
+        return await self._fetch_until_short_page(
+            lambda page: self.list_payroll_employees(page=page, status=status),
+            max_concurrency,
+        )